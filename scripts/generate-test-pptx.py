@@ -9,146 +9,333 @@ from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE, MSO_CONNECTOR
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.dml import MSO_THEME_COLOR
-from pptx.oxml.ns import nsmap
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, nsmap
+from pptx.opc.serialized import _ZipPkgWriter
+from pptx.shapes.autoshape import AutoShapeType
+from pptx.util import lazyproperty
+from multiprocessing import Pool
+from xml.sax.saxutils import escape
+import argparse
+import copy
+import io
 import os
+import re
+import zipfile
 
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures')
 
+@lazyproperty
+def _zipf(self):
+    """`ZipFile` open for writing with the cheapest DEFLATE level.
+
+    Fixtures are regenerated on every run, so trading a little size for much less
+    compression time is worthwhile. Level 1 output is still plain DEFLATE.
+    """
+    return zipfile.ZipFile(
+        self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1, strict_timestamps=False
+    )
+
+_ZipPkgWriter._zipf = _zipf
+
+# RGBColor is an immutable tuple subclass, so shared instances are safe to reuse
+PALETTE = {
+    'blue': RGBColor(0x00, 0x00, 0xFF),
+    'crimson': RGBColor(0xDC, 0x14, 0x3C),
+    'cyan': RGBColor(0x00, 0xFF, 0xFF),
+    'dark_gray': RGBColor(0x33, 0x33, 0x33),
+    'dark_violet': RGBColor(0x94, 0x00, 0xD3),
+    'gold': RGBColor(0xFF, 0xD7, 0x00),
+    'green': RGBColor(0x00, 0x80, 0x00),
+    'hot_pink': RGBColor(0xFF, 0x69, 0xB4),
+    'indigo': RGBColor(0x4B, 0x00, 0x82),
+    'lime': RGBColor(0x00, 0xFF, 0x00),
+    'lime_green': RGBColor(0x32, 0xCD, 0x32),
+    'midnight': RGBColor(0x1A, 0x1A, 0x2E),
+    'orange': RGBColor(0xFF, 0xA5, 0x00),
+    'purple': RGBColor(0x80, 0x00, 0x80),
+    'red': RGBColor(0xFF, 0x00, 0x00),
+    'royal_blue': RGBColor(0x41, 0x69, 0xE1),
+    'sky_blue': RGBColor(0x87, 0xCE, 0xEB),
+    'slate': RGBColor(0x2C, 0x3E, 0x50),
+    'teal': RGBColor(0x00, 0x80, 0x80),
+    'violet': RGBColor(0x66, 0x00, 0xFF),
+    'white': RGBColor(0xFF, 0xFF, 0xFF),
+    'yellow': RGBColor(0xFF, 0xFF, 0x00),
+}
+
+PT = {size: Pt(size) for size in (11, 12, 14, 16, 18, 24, 28, 32, 36, 44, 48)}
+
+def _emu(inches):
+    """Convert inches to an integer EMU value (914400 EMU per inch)."""
+    return int(inches * 914400)
+
+# EMU offsets for the comprehensive fixture's shape grid, folded to plain ints once
+I_0_3 = _emu(0.3)
+I_0_8 = _emu(0.8)
+I_1 = _emu(1)
+I_1_2 = _emu(1.2)
+I_1_4 = _emu(1.4)
+I_1_6 = _emu(1.6)
+I_1_8 = _emu(1.8)
+I_2 = _emu(2)
+I_2_3 = _emu(2.3)
+I_2_4 = _emu(2.4)
+I_2_5 = _emu(2.5)
+I_4_3 = _emu(4.3)
+I_4_7 = _emu(4.7)
+I_6_3 = _emu(6.3)
+I_6_9 = _emu(6.9)
+I_8_1 = _emu(8.1)
+I_8_5 = _emu(8.5)
+
+# Solid-filled autoshape matching what python-pptx emits for add_shape() + fill.solid()
+# (+ text and paragraph font settings), but built in one parse; the last slot is the <a:p> body
+SOLID_SHAPE_XML = (
+    '<p:sp %s>'
+    '<p:nvSpPr><p:cNvPr id="%%d" name="%%s"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>'
+    '<a:xfrm><a:off x="%%d" y="%%d"/><a:ext cx="%%d" cy="%%d"/></a:xfrm>'
+    '<a:prstGeom prst="%%s"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="%%s"/></a:solidFill>'
+    '</p:spPr>'
+    '<p:style>'
+    '<a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef>'
+    '</p:style>'
+    '<p:txBody>'
+    '<a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>'
+    '%%s'
+    '</p:txBody>'
+    '</p:sp>'
+) % nsdecls('a', 'p')
+
+def text_xml(text):
+    """Return `text` escaped for `<a:t>` content, as python-pptx's run.text setter stores it.
+
+    Control characters other than tab and line feed are not allowed in XML, so they become
+    `_xHHHH_` escapes (e.g. BEL is "_x0007_"), then markup characters are entity-escaped.
+    """
+    return escape(re.sub(r'[\x00-\x08\x0B-\x1F]', lambda m: '_x%04X_' % ord(m.group()), text))
+
+def paragraph_text_xml(text):
+    """Return the runs for one paragraph's `text`, split as python-pptx's paragraph.text setter does.
+
+    Line feeds and vertical tabs become `<a:br/>` between runs, and empty runs are omitted.
+    """
+    return '<a:br/>'.join(
+        '<a:r><a:t>%s</a:t></a:r>' % text_xml(line) if line else ''
+        for line in re.split('\n|\v', text)
+    )
+
+def add_solid_shape(shapes, shape_type, left, top, width, height, color, text=None, size=None, bold=False, align=None):
+    """Append a solid-filled autoshape, optionally labelled with `text`, to `shapes`.
+
+    `text` is split into paragraphs on line feeds, as shape.text does, and `size`, `bold` and
+    `align` apply to every paragraph. They need `text`; an unlabelled shape cannot take them.
+    """
+    if text is None:
+        if size or bold or align:
+            raise ValueError('size, bold and align require text')
+        # add_shape() leaves one empty, centered paragraph
+        paragraphs = '<a:p><a:pPr algn="ctr"/></a:p>'
+    else:
+        attrs = (' sz="%d"' % (size.pt * 100) if size else '') + (' b="1"' if bold else '')
+        algn = ' algn="%s"' % PP_ALIGN.to_xml(align) if align else ''
+        if attrs:
+            ppr = '<a:pPr%s><a:defRPr%s/></a:pPr>' % (algn, attrs)
+        elif algn:
+            ppr = '<a:pPr%s/>' % algn
+        else:
+            ppr = ''
+        paragraphs = ''.join('<a:p>%s%s</a:p>' % (ppr, paragraph_text_xml(line)) for line in text.split('\n'))
+    autoshape_type = AutoShapeType(shape_type)
+    shape_id = shapes._next_shape_id
+    name = '%s %d' % (autoshape_type.basename, shape_id - 1)
+    shapes._spTree.append(parse_xml(SOLID_SHAPE_XML % (
+        shape_id, name, left, top, width, height, autoshape_type.prst, color, paragraphs
+    )))
+
+def table_cells_xml(values, bold=False, size=None, color=None, fill=None):
+    """Return the `<a:tc>` elements for one table row whose cells share formatting."""
+    attrs = (' b="1"' if bold else '') + (' sz="%d"' % (size.pt * 100) if size else '')
+    if color:
+        ppr = '<a:pPr><a:defRPr%s><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:defRPr></a:pPr>' % (attrs, color)
+    elif attrs:
+        ppr = '<a:pPr><a:defRPr%s/></a:pPr>' % attrs
+    else:
+        ppr = ''
+    tc_pr = '<a:tcPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr>' % (fill,) if fill else '<a:tcPr/>'
+    return ''.join(
+        '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p>%s<a:r><a:t>%s</a:t></a:r></a:p></a:txBody>%s</a:tc>'
+        % (ppr, text_xml(value), tc_pr)
+        for value in values
+    )
+
+def set_table_rows(table, rows):
+    """Replace the rows python-pptx created for `table` with pre-built cell XML, keeping row heights.
+
+    Raises ValueError, leaving the table untouched, if `rows` does not match the table's row count
+    or a row's cell count differs from its column count.
+    """
+    tbl = table._tbl
+    columns = len(tbl.tblGrid.gridCol_lst)
+    new_rows = []
+    for tr, cells in zip(tbl.tr_lst, rows, strict=True):
+        new_tr = parse_xml('<a:tr %s h="%d">%s</a:tr>' % (nsdecls('a'), tr.h, cells))
+        if len(new_tr.tc_lst) != columns:
+            raise ValueError('row has %d cells, table has %d columns' % (len(new_tr.tc_lst), columns))
+        new_rows.append(new_tr)
+    for tr in tbl.tr_lst:
+        tbl.remove(tr)
+    tbl.extend(new_rows)
+
+def run_xml(text, size=None, bold=False, italic=False, underline=False, color=None):
+    """Return `<a:r>` XML for a text run with the given character formatting."""
+    attrs = (
+        (' sz="%d"' % (size.pt * 100) if size else '')
+        + (' b="1"' if bold else '')
+        + (' i="1"' if italic else '')
+        + (' u="sng"' if underline else '')
+    )
+    if color:
+        rpr = '<a:rPr%s><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:rPr>' % (attrs, color)
+    elif attrs:
+        rpr = '<a:rPr%s/>' % attrs
+    else:
+        rpr = ''
+    return '<a:r>%s<a:t>%s</a:t></a:r>' % (rpr, text_xml(text))
+
+def set_runs(tf, runs, align=None):
+    """Replace the first paragraph of `tf` with one built from pre-rendered `runs` in a single parse."""
+    ppr = '<a:pPr algn="%s"/>' % PP_ALIGN.to_xml(align) if align else ''
+    p = parse_xml('<a:p %s>%s%s</a:p>' % (nsdecls('a'), ppr, ''.join(runs)))
+    tx_body = tf._txBody
+    tx_body.replace(tx_body.p_lst[0], p)
+
+def set_bullets(tf, items, size):
+    """Replace the paragraphs of `tf` with one `size`-point paragraph per item, built in a single parse.
+
+    With no items, one empty paragraph is kept, since a text body needs at least one `<a:p>`.
+    """
+    paragraphs = parse_xml('<a:txBody %s>%s</a:txBody>' % (nsdecls('a'), ''.join(
+        '<a:p><a:pPr><a:defRPr sz="%d"/></a:pPr>%s</a:p>' % (size.pt * 100, paragraph_text_xml(item))
+        for item in items
+    ) or '<a:p/>'))
+    tx_body = tf._txBody
+    for p in tx_body.p_lst:
+        tx_body.remove(p)
+    tx_body.extend(list(paragraphs))
+
+# Parsed once; every fixture starts from a deep copy instead of reloading the default template
+# (don't read proxies such as slide_layouts off it: they are cached and would be deep-copied
+# into every clone still pointing at the template's XML)
+_TEMPLATE = Presentation()
+
+def new_presentation():
+    """Return a fresh presentation cloned from the shared default template."""
+    return copy.deepcopy(_TEMPLATE)
+
 def ensure_output_dir():
     """Ensure the output directory exists."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+def save_presentation(prs, filename):
+    """Serialise `prs` in memory, then atomically replace `filename` in the output directory."""
+    buf = io.BytesIO()
+    prs.save(buf)
+    path = os.path.join(OUTPUT_DIR, filename)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(buf.getbuffer())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a stray .tmp next to the fixtures
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
 def create_basic_shapes_pptx():
     """Create a PPTX with various basic shapes."""
-    prs = Presentation()
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]  # Blank layout
     prs.slide_width = Inches(10)
     prs.slide_height = Inches(7.5)
 
-    slide_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(blank)
+    shapes = slide.shapes
 
     # Rectangle
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.5), Inches(0.5), Inches(2), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x41, 0x69, 0xE1)  # Royal Blue
-    shape.text = "Rectangle"
+    add_solid_shape(shapes, MSO_SHAPE.RECTANGLE, Inches(0.5), Inches(0.5), Inches(2), Inches(1), PALETTE['royal_blue'], "Rectangle")
 
     # Rounded Rectangle
-    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(3), Inches(0.5), Inches(2), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x32, 0xCD, 0x32)  # Lime Green
-    shape.text = "Rounded Rect"
+    add_solid_shape(shapes, MSO_SHAPE.ROUNDED_RECTANGLE, Inches(3), Inches(0.5), Inches(2), Inches(1), PALETTE['lime_green'], "Rounded Rect")
 
     # Ellipse
-    shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(5.5), Inches(0.5), Inches(2), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0xFF, 0x69, 0xB4)  # Hot Pink
-    shape.text = "Ellipse"
+    add_solid_shape(shapes, MSO_SHAPE.OVAL, Inches(5.5), Inches(0.5), Inches(2), Inches(1), PALETTE['hot_pink'], "Ellipse")
 
     # Triangle
-    shape = slide.shapes.add_shape(MSO_SHAPE.ISOSCELES_TRIANGLE, Inches(0.5), Inches(2), Inches(2), Inches(1.5))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0xFF, 0xA5, 0x00)  # Orange
+    add_solid_shape(shapes, MSO_SHAPE.ISOSCELES_TRIANGLE, Inches(0.5), Inches(2), Inches(2), Inches(1.5), PALETTE['orange'])
 
     # Diamond
-    shape = slide.shapes.add_shape(MSO_SHAPE.DIAMOND, Inches(3), Inches(2), Inches(2), Inches(1.5))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x94, 0x00, 0xD3)  # Purple
+    add_solid_shape(shapes, MSO_SHAPE.DIAMOND, Inches(3), Inches(2), Inches(2), Inches(1.5), PALETTE['dark_violet'])
 
     # Star
-    shape = slide.shapes.add_shape(MSO_SHAPE.STAR_5_POINT, Inches(5.5), Inches(2), Inches(2), Inches(1.5))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0xFF, 0xD7, 0x00)  # Gold
+    add_solid_shape(shapes, MSO_SHAPE.STAR_5_POINT, Inches(5.5), Inches(2), Inches(2), Inches(1.5), PALETTE['gold'])
 
     # Arrow
-    shape = slide.shapes.add_shape(MSO_SHAPE.RIGHT_ARROW, Inches(0.5), Inches(4), Inches(2.5), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x00, 0x80, 0x80)  # Teal
+    add_solid_shape(shapes, MSO_SHAPE.RIGHT_ARROW, Inches(0.5), Inches(4), Inches(2.5), Inches(1), PALETTE['teal'])
 
     # Heart
-    shape = slide.shapes.add_shape(MSO_SHAPE.HEART, Inches(3.5), Inches(4), Inches(1.5), Inches(1.5))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0xFF, 0x00, 0x00)  # Red
+    add_solid_shape(shapes, MSO_SHAPE.HEART, Inches(3.5), Inches(4), Inches(1.5), Inches(1.5), PALETTE['red'])
 
     # Cloud
-    shape = slide.shapes.add_shape(MSO_SHAPE.CLOUD, Inches(5.5), Inches(4), Inches(2.5), Inches(1.5))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x87, 0xCE, 0xEB)  # Sky Blue
+    add_solid_shape(shapes, MSO_SHAPE.CLOUD, Inches(5.5), Inches(4), Inches(2.5), Inches(1.5), PALETTE['sky_blue'])
 
-    prs.save(os.path.join(OUTPUT_DIR, 'basic-shapes.pptx'))
+    save_presentation(prs, 'basic-shapes.pptx')
     print("Created basic-shapes.pptx")
 
 def create_text_formatting_pptx():
     """Create a PPTX with various text formatting options."""
-    prs = Presentation()
-    slide_layout = prs.slide_layouts[6]  # Blank
-    slide = prs.slides.add_slide(slide_layout)
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(blank)
 
     # Title
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.8))
-    tf = shape.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    run = p.add_run()
-    run.text = "Text Formatting Test"
-    run.font.size = Pt(36)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
+    set_runs(shape.text_frame, [
+        run_xml("Text Formatting Test", size=PT[36], bold=True, color=PALETTE['dark_gray']),
+    ], align=PP_ALIGN.CENTER)
 
     # Bold, Italic, Underline
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(4), Inches(0.5))
-    tf = shape.text_frame
-    p = tf.paragraphs[0]
-
-    run = p.add_run()
-    run.text = "Bold "
-    run.font.bold = True
-    run.font.size = Pt(18)
-
-    run = p.add_run()
-    run.text = "Italic "
-    run.font.italic = True
-    run.font.size = Pt(18)
-
-    run = p.add_run()
-    run.text = "Underline "
-    run.font.underline = True
-    run.font.size = Pt(18)
-
-    run = p.add_run()
-    run.text = "Strikethrough"
-    run.font.size = Pt(18)
-    # Note: strikethrough not directly supported in python-pptx
+    set_runs(shape.text_frame, [
+        run_xml("Bold ", size=PT[18], bold=True),
+        run_xml("Italic ", size=PT[18], italic=True),
+        run_xml("Underline ", size=PT[18], underline=True),
+        run_xml("Strikethrough", size=PT[18]),
+        # Note: strikethrough not directly supported in python-pptx
+    ])
 
     # Different colors
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(1.8), Inches(8), Inches(0.5))
-    tf = shape.text_frame
-    p = tf.paragraphs[0]
-
     colors = [
-        ("Red ", RGBColor(0xFF, 0x00, 0x00)),
-        ("Green ", RGBColor(0x00, 0x80, 0x00)),
-        ("Blue ", RGBColor(0x00, 0x00, 0xFF)),
-        ("Orange ", RGBColor(0xFF, 0xA5, 0x00)),
-        ("Purple", RGBColor(0x80, 0x00, 0x80)),
+        ("Red ", PALETTE['red']),
+        ("Green ", PALETTE['green']),
+        ("Blue ", PALETTE['blue']),
+        ("Orange ", PALETTE['orange']),
+        ("Purple", PALETTE['purple']),
     ]
 
-    for text, color in colors:
-        run = p.add_run()
-        run.text = text
-        run.font.color.rgb = color
-        run.font.size = Pt(18)
+    set_runs(shape.text_frame, [run_xml(text, size=PT[18], color=color) for text, color in colors])
 
     # Different sizes
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(2.4), Inches(8), Inches(1))
-    tf = shape.text_frame
-    p = tf.paragraphs[0]
-
     sizes = [12, 18, 24, 36, 48]
-    for size in sizes:
-        run = p.add_run()
-        run.text = f"{size}pt "
-        run.font.size = Pt(size)
+    set_runs(shape.text_frame, [run_xml(f"{size}pt ", size=PT[size]) for size in sizes])
 
     # Bullet list
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(3.8), Inches(4), Inches(2))
@@ -156,14 +343,7 @@ def create_text_formatting_pptx():
     tf.word_wrap = True
 
     items = ["First bullet item", "Second bullet item", "Third bullet item"]
-    for i, item in enumerate(items):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = item
-        p.level = 0
-        p.font.size = Pt(16)
+    set_bullets(tf, items, PT[16])
 
     # Numbered list (simulated)
     shape = slide.shapes.add_textbox(Inches(5), Inches(3.8), Inches(4), Inches(2))
@@ -171,30 +351,25 @@ def create_text_formatting_pptx():
     tf.word_wrap = True
 
     items = ["1. First numbered item", "2. Second numbered item", "3. Third numbered item"]
-    for i, item in enumerate(items):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = item
-        p.font.size = Pt(16)
+    set_bullets(tf, items, PT[16])
 
-    prs.save(os.path.join(OUTPUT_DIR, 'text-formatting.pptx'))
+    save_presentation(prs, 'text-formatting.pptx')
     print("Created text-formatting.pptx")
 
 def create_gradients_pptx():
     """Create a PPTX with gradient fills."""
-    prs = Presentation()
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(blank)
 
     # Linear gradient (horizontal)
     shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.5), Inches(0.5), Inches(3), Inches(2))
     fill = shape.fill
     fill.gradient()
     fill.gradient_angle = 0
-    fill.gradient_stops[0].color.rgb = RGBColor(0xFF, 0x00, 0x00)
-    fill.gradient_stops[1].color.rgb = RGBColor(0x00, 0x00, 0xFF)
+    stops = fill.gradient_stops
+    stops[0].color.rgb = PALETTE['red']
+    stops[1].color.rgb = PALETTE['blue']
     shape.text = "Linear H"
 
     # Linear gradient (vertical)
@@ -202,8 +377,9 @@ def create_gradients_pptx():
     fill = shape.fill
     fill.gradient()
     fill.gradient_angle = 90
-    fill.gradient_stops[0].color.rgb = RGBColor(0x00, 0xFF, 0x00)
-    fill.gradient_stops[1].color.rgb = RGBColor(0xFF, 0xFF, 0x00)
+    stops = fill.gradient_stops
+    stops[0].color.rgb = PALETTE['lime']
+    stops[1].color.rgb = PALETTE['yellow']
     shape.text = "Linear V"
 
     # Diagonal gradient
@@ -211,8 +387,9 @@ def create_gradients_pptx():
     fill = shape.fill
     fill.gradient()
     fill.gradient_angle = 45
-    fill.gradient_stops[0].color.rgb = RGBColor(0x80, 0x00, 0x80)
-    fill.gradient_stops[1].color.rgb = RGBColor(0xFF, 0xA5, 0x00)
+    stops = fill.gradient_stops
+    stops[0].color.rgb = PALETTE['purple']
+    stops[1].color.rgb = PALETTE['orange']
     shape.text = "Diagonal"
 
     # Gradient on rounded rect
@@ -220,42 +397,43 @@ def create_gradients_pptx():
     fill = shape.fill
     fill.gradient()
     fill.gradient_angle = 135
-    fill.gradient_stops[0].color.rgb = RGBColor(0x00, 0x80, 0x80)
-    fill.gradient_stops[1].color.rgb = RGBColor(0xFF, 0x69, 0xB4)
+    stops = fill.gradient_stops
+    stops[0].color.rgb = PALETTE['teal']
+    stops[1].color.rgb = PALETTE['hot_pink']
     shape.text = "Rounded Gradient"
 
-    prs.save(os.path.join(OUTPUT_DIR, 'gradients.pptx'))
+    save_presentation(prs, 'gradients.pptx')
     print("Created gradients.pptx")
 
 def create_images_pptx():
     """Create a PPTX with images (placeholder for now)."""
-    prs = Presentation()
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(blank)
 
     # Add a text note about images
     shape = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(2))
     tf = shape.text_frame
     p = tf.paragraphs[0]
     p.text = "Image test - add images manually or use a sample image"
-    p.font.size = Pt(24)
+    p.font.size = PT[24]
     p.alignment = PP_ALIGN.CENTER
 
-    prs.save(os.path.join(OUTPUT_DIR, 'images.pptx'))
+    save_presentation(prs, 'images.pptx')
     print("Created images.pptx (placeholder)")
 
 def create_tables_pptx():
     """Create a PPTX with tables."""
-    prs = Presentation()
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(blank)
 
     # Title
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6))
     tf = shape.text_frame
     p = tf.paragraphs[0]
     p.text = "Table Test"
-    p.font.size = Pt(28)
+    p.font.size = PT[28]
     p.font.bold = True
     p.alignment = PP_ALIGN.CENTER
 
@@ -274,14 +452,6 @@ def create_tables_pptx():
 
     # Header row
     headers = ["Name", "Department", "Status"]
-    for col, header in enumerate(headers):
-        cell = table.cell(0, col)
-        cell.text = header
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0x41, 0x69, 0xE1)
-        p = cell.text_frame.paragraphs[0]
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
 
     # Data rows
     data = [
@@ -290,63 +460,57 @@ def create_tables_pptx():
         ["Carol Williams", "Sales", "On Leave"],
     ]
 
-    for row_idx, row_data in enumerate(data, start=1):
-        for col_idx, value in enumerate(row_data):
-            cell = table.cell(row_idx, col_idx)
-            cell.text = value
+    set_table_rows(table, [
+        table_cells_xml(headers, bold=True, color=PALETTE['white'], fill=PALETTE['royal_blue']),
+        *(table_cells_xml(row_data) for row_data in data),
+    ])
 
-    prs.save(os.path.join(OUTPUT_DIR, 'tables.pptx'))
+    save_presentation(prs, 'tables.pptx')
     print("Created tables.pptx")
 
 def create_multi_slide_pptx():
     """Create a PPTX with multiple slides."""
-    prs = Presentation()
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]  # Blank layout
 
     # Slide 1 - Title
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(blank)
 
     shape = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(1.5))
     tf = shape.text_frame
     p = tf.paragraphs[0]
     p.text = "Multi-Slide Presentation"
-    p.font.size = Pt(44)
+    p.font.size = PT[44]
     p.font.bold = True
     p.alignment = PP_ALIGN.CENTER
 
     p = tf.add_paragraph()
     p.text = "Testing slide navigation"
-    p.font.size = Pt(24)
+    p.font.size = PT[24]
     p.alignment = PP_ALIGN.CENTER
 
     # Slide 2 - Content
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(blank)
 
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
     tf = shape.text_frame
     p = tf.paragraphs[0]
     p.text = "Slide 2: Content Slide"
-    p.font.size = Pt(32)
+    p.font.size = PT[32]
     p.font.bold = True
 
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1), Inches(2), Inches(3), Inches(2))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x41, 0x69, 0xE1)
-    shape.text = "Shape 1"
+    add_solid_shape(slide.shapes, MSO_SHAPE.RECTANGLE, Inches(1), Inches(2), Inches(3), Inches(2), PALETTE['royal_blue'], "Shape 1")
 
-    shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(5), Inches(2), Inches(3), Inches(2))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x32, 0xCD, 0x32)
-    shape.text = "Shape 2"
+    add_solid_shape(slide.shapes, MSO_SHAPE.OVAL, Inches(5), Inches(2), Inches(3), Inches(2), PALETTE['lime_green'], "Shape 2")
 
     # Slide 3 - More content
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(blank)
 
     shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
     tf = shape.text_frame
     p = tf.paragraphs[0]
     p.text = "Slide 3: Final Slide"
-    p.font.size = Pt(32)
+    p.font.size = PT[32]
     p.font.bold = True
 
     shape = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(3))
@@ -354,162 +518,139 @@ def create_multi_slide_pptx():
     tf.word_wrap = True
     p = tf.paragraphs[0]
     p.text = "This is the final slide of the presentation. It contains text content to verify multi-slide navigation works correctly."
-    p.font.size = Pt(18)
+    p.font.size = PT[18]
 
-    prs.save(os.path.join(OUTPUT_DIR, 'multi-slide.pptx'))
+    save_presentation(prs, 'multi-slide.pptx')
     print("Created multi-slide.pptx")
 
 def create_comprehensive_pptx():
     """Create a comprehensive test PPTX with many features."""
-    prs = Presentation()
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]  # Blank layout
     prs.slide_width = Inches(10)
     prs.slide_height = Inches(7.5)
 
-    slide_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(blank)
+    shapes = slide.shapes
 
     # Title
-    shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(0.7))
+    shape = shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(0.7))
     tf = shape.text_frame
     p = tf.paragraphs[0]
     p.text = "Comprehensive Feature Test"
-    p.font.size = Pt(32)
+    p.font.size = PT[32]
     p.font.bold = True
     p.alignment = PP_ALIGN.CENTER
-    p.font.color.rgb = RGBColor(0x1a, 0x1a, 0x2e)
-
-    # Row 1: Basic shapes with different fills
-    shapes_data = [
-        (MSO_SHAPE.RECTANGLE, Inches(0.3), Inches(1), Inches(1.8), Inches(1.2), RGBColor(0x41, 0x69, 0xE1), "Rect"),
-        (MSO_SHAPE.ROUNDED_RECTANGLE, Inches(2.3), Inches(1), Inches(1.8), Inches(1.2), RGBColor(0x32, 0xCD, 0x32), "Round"),
-        (MSO_SHAPE.OVAL, Inches(4.3), Inches(1), Inches(1.8), Inches(1.2), RGBColor(0xFF, 0x69, 0xB4), "Oval"),
-        (MSO_SHAPE.DIAMOND, Inches(6.3), Inches(1), Inches(1.8), Inches(1.2), RGBColor(0xFF, 0xA5, 0x00), "Diamond"),
-        (MSO_SHAPE.STAR_5_POINT, Inches(8.1), Inches(1), Inches(1.6), Inches(1.2), RGBColor(0xFF, 0xD7, 0x00), "Star"),
-    ]
+    p.font.color.rgb = PALETTE['midnight']
+
+    # Row 1: Basic shapes with different fills, stored column-wise; the row shares one top and height
+    shape_types = (
+        MSO_SHAPE.RECTANGLE, MSO_SHAPE.ROUNDED_RECTANGLE, MSO_SHAPE.OVAL, MSO_SHAPE.DIAMOND, MSO_SHAPE.STAR_5_POINT,
+    )
+    lefts = (I_0_3, I_2_3, I_4_3, I_6_3, I_8_1)
+    widths = (I_1_8, I_1_8, I_1_8, I_1_8, I_1_6)
+    colors = (PALETTE['royal_blue'], PALETTE['lime_green'], PALETTE['hot_pink'], PALETTE['orange'], PALETTE['gold'])
+    labels = ("Rect", "Round", "Oval", "Diamond", "Star")
+    top, height = I_1, I_1_2
 
-    for shape_type, left, top, width, height, color, text in shapes_data:
-        shape = slide.shapes.add_shape(shape_type, left, top, width, height)
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = color
-        shape.text = text
-        for p in shape.text_frame.paragraphs:
-            p.font.size = Pt(12)
-            p.font.bold = True
-            p.alignment = PP_ALIGN.CENTER
+    for shape_type, left, width, color, text in zip(shape_types, lefts, widths, colors, labels):
+        add_solid_shape(shapes, shape_type, left, top, width, height, color, text, size=PT[12], bold=True, align=PP_ALIGN.CENTER)
 
     # Row 2: Arrows and more shapes
-    shape = slide.shapes.add_shape(MSO_SHAPE.RIGHT_ARROW, Inches(0.3), Inches(2.5), Inches(2), Inches(0.8))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x00, 0x80, 0x80)
+    add_solid_shape(shapes, MSO_SHAPE.RIGHT_ARROW, I_0_3, I_2_5, I_2, I_0_8, PALETTE['teal'])
 
-    shape = slide.shapes.add_shape(MSO_SHAPE.LEFT_ARROW, Inches(2.5), Inches(2.5), Inches(2), Inches(0.8))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x80, 0x00, 0x80)
+    add_solid_shape(shapes, MSO_SHAPE.LEFT_ARROW, I_2_5, I_2_5, I_2, I_0_8, PALETTE['purple'])
 
-    shape = slide.shapes.add_shape(MSO_SHAPE.CHEVRON, Inches(4.7), Inches(2.5), Inches(2), Inches(0.8))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0xDC, 0x14, 0x3C)
+    add_solid_shape(shapes, MSO_SHAPE.CHEVRON, I_4_7, I_2_5, I_2, I_0_8, PALETTE['crimson'])
 
-    shape = slide.shapes.add_shape(MSO_SHAPE.HEXAGON, Inches(6.9), Inches(2.4), Inches(1.4), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x4B, 0x00, 0x82)
+    add_solid_shape(shapes, MSO_SHAPE.HEXAGON, I_6_9, I_2_4, I_1_4, I_1, PALETTE['indigo'])
 
-    shape = slide.shapes.add_shape(MSO_SHAPE.HEART, Inches(8.5), Inches(2.4), Inches(1.2), Inches(1))
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0xFF, 0x00, 0x00)
+    add_solid_shape(shapes, MSO_SHAPE.HEART, I_8_5, I_2_4, I_1_2, I_1, PALETTE['red'])
 
     # Row 3: Text formatting samples
-    shape = slide.shapes.add_textbox(Inches(0.3), Inches(3.6), Inches(4.5), Inches(1.2))
+    shape = shapes.add_textbox(Inches(0.3), Inches(3.6), Inches(4.5), Inches(1.2))
     tf = shape.text_frame
     tf.word_wrap = True
 
-    p = tf.paragraphs[0]
-    run = p.add_run()
-    run.text = "Bold "
-    run.font.bold = True
-    run.font.size = Pt(14)
-
-    run = p.add_run()
-    run.text = "Italic "
-    run.font.italic = True
-    run.font.size = Pt(14)
-
-    run = p.add_run()
-    run.text = "Underline "
-    run.font.underline = True
-    run.font.size = Pt(14)
-
-    run = p.add_run()
-    run.text = "Color"
-    run.font.color.rgb = RGBColor(0xFF, 0x00, 0x00)
-    run.font.size = Pt(14)
+    set_runs(tf, [
+        run_xml("Bold ", size=PT[14], bold=True),
+        run_xml("Italic ", size=PT[14], italic=True),
+        run_xml("Underline ", size=PT[14], underline=True),
+        run_xml("Color", size=PT[14], color=PALETTE['red']),
+    ])
 
     # Gradient shape
-    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(5), Inches(3.6), Inches(4.5), Inches(1.2))
+    shape = shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(5), Inches(3.6), Inches(4.5), Inches(1.2))
     fill = shape.fill
     fill.gradient()
     fill.gradient_angle = 45
-    fill.gradient_stops[0].color.rgb = RGBColor(0x66, 0x00, 0xFF)
-    fill.gradient_stops[1].color.rgb = RGBColor(0x00, 0xFF, 0xFF)
+    stops = fill.gradient_stops
+    stops[0].color.rgb = PALETTE['violet']
+    stops[1].color.rgb = PALETTE['cyan']
     shape.text = "Gradient Fill"
     for p in shape.text_frame.paragraphs:
-        p.font.size = Pt(14)
+        p.font.size = PT[14]
         p.font.bold = True
-        p.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+        p.font.color.rgb = PALETTE['white']
         p.alignment = PP_ALIGN.CENTER
 
     # Row 4: Small table
-    table = slide.shapes.add_table(2, 3, Inches(0.3), Inches(5.2), Inches(5), Inches(1)).table
+    table = shapes.add_table(2, 3, Inches(0.3), Inches(5.2), Inches(5), Inches(1)).table
 
     headers = ["Column A", "Column B", "Column C"]
-    for col, header in enumerate(headers):
-        cell = table.cell(0, col)
-        cell.text = header
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0x2C, 0x3E, 0x50)
-        p = cell.text_frame.paragraphs[0]
-        p.font.bold = True
-        p.font.size = Pt(11)
-        p.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
-
     data = ["Value 1", "Value 2", "Value 3"]
-    for col, value in enumerate(data):
-        cell = table.cell(1, col)
-        cell.text = value
-        p = cell.text_frame.paragraphs[0]
-        p.font.size = Pt(11)
+    set_table_rows(table, [
+        table_cells_xml(headers, bold=True, size=PT[11], color=PALETTE['white'], fill=PALETTE['slate']),
+        table_cells_xml(data, size=PT[11]),
+    ])
 
     # Text box with bullet points
-    shape = slide.shapes.add_textbox(Inches(5.5), Inches(5.2), Inches(4), Inches(1.5))
+    shape = shapes.add_textbox(Inches(5.5), Inches(5.2), Inches(4), Inches(1.5))
     tf = shape.text_frame
     tf.word_wrap = True
 
     bullets = ["First item", "Second item", "Third item"]
-    for i, bullet in enumerate(bullets):
-        if i == 0:
-            p = tf.paragraphs[0]
-        else:
-            p = tf.add_paragraph()
-        p.text = f"• {bullet}"
-        p.font.size = Pt(12)
+    set_bullets(tf, [f"• {bullet}" for bullet in bullets], PT[12])
 
-    prs.save(os.path.join(OUTPUT_DIR, 'comprehensive.pptx'))
+    save_presentation(prs, 'comprehensive.pptx')
     print("Created comprehensive.pptx")
 
+GENERATORS = [
+    create_basic_shapes_pptx,
+    create_text_formatting_pptx,
+    create_gradients_pptx,
+    create_tables_pptx,
+    create_multi_slide_pptx,
+    create_comprehensive_pptx,
+    create_images_pptx,
+]
+
+def _run(generator):
+    """Run a single fixture generator (top-level so it can be pickled)."""
+    generator()
+
 def main():
     """Generate all test PPTX files."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--parallel', action='store_true',
+        help='build fixtures in a process pool (output order of the "Created" lines varies)',
+    )
+    args = parser.parse_args()
+
     ensure_output_dir()
 
     print(f"Generating test PPTX files in {OUTPUT_DIR}...")
     print("-" * 50)
 
-    create_basic_shapes_pptx()
-    create_text_formatting_pptx()
-    create_gradients_pptx()
-    create_tables_pptx()
-    create_multi_slide_pptx()
-    create_comprehensive_pptx()
-    create_images_pptx()
+    # Fixtures are independent, but at their current size process start-up outweighs
+    # the work, so the pool is opt-in and skipped on single-core machines
+    if args.parallel and (os.cpu_count() or 1) > 1:
+        with Pool() as pool:
+            pool.map(_run, GENERATORS)
+    else:
+        for generator in GENERATORS:
+            generator()
 
     print("-" * 50)
     print("Done! Test files created in tests/fixtures/")